@@ -1,13 +1,20 @@
 import streamlit as st
 import openmeteo_requests
 import pandas as pd
-import requests_cache
+import numpy as np
+import pyarrow as pa
+import requests
 from retry_requests import retry
+from scipy.ndimage import uniform_filter1d
 import seaborn as sns
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+import matplotlib.dates as mdates
 import datetime
+import io
+import concurrent.futures
 
 
+sns.set_style("whitegrid")
 
 st.title("🎈 NAIROBI SHORT LIVED CLIMATE POLLUTANTS MONITORING DASHBOARD")
 st.write(
@@ -28,198 +35,362 @@ params = {
     "timezone": "Africa/Nairobi"
 }
 
-# --- Caching and Retries for API Calls ---
-cache_session = requests_cache.CachedSession('.cache', expires_after=3600)
-retry_session = retry(cache_session, retries=5, backoff_factor=0.2)
-openmeteo = openmeteo_requests.Client(session=retry_session)
+# --- Guideline thresholds (µg/m³) ---
+OZONE_8HR_THRESHOLD = 100
+NO2_THRESHOLD = 20
+PM_DAILY_THRESHOLD = 15
+
+# --- Retries for API Calls ---
+@st.cache_resource
+def get_client():
+    """
+    Builds the retrying Open-Meteo client.
+    Shared across reruns and sessions so the HTTP session is built once per process.
+    Caching is left to st.cache_data on load_data.
+    """
+    retry_session = retry(requests.Session(), retries=5, backoff_factor=0.2)
+    return openmeteo_requests.Client(session=retry_session)
+
+
+def fetch_hourly(openmeteo, url, params, variable):
+    """
+    Requests a single hourly variable and returns the Hourly block of the
+    (single location) response.
+    """
+    responses = openmeteo.weather_api(url, params={**params, "hourly": variable})
+    return responses[0].Hourly()
+
 
 # Use Streamlit's cache to store the API response
-@st.cache_data(ttl=86400) # Data will be re-fetched after 1 hour
+@st.cache_data(ttl=86400) # Data will be re-fetched after 1 day
 def load_data(url, params):
     """
-    Loads data from the Open-Meteo API.
-    Returns a list of WeatherAPIResponse objects.
+    Loads data from the Open-Meteo API, one request per hourly variable issued
+    in parallel so a cold fetch waits for the slowest request, not their sum.
+    Returns a (start, end, interval, ozone, pm, no2) tuple of plain ints and
+    NumPy arrays, which Streamlit can pickle and hash cheaply.
     """
+    openmeteo = get_client()
+    variables = params["hourly"]
     try:
-        responses = openmeteo.weather_api(url, params=params)
-        return responses
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(variables)) as pool:
+            hourlies = list(pool.map(lambda variable: fetch_hourly(openmeteo, url, params, variable), variables))
     except Exception as e:
         st.error(f"Error fetching data from the API: {e}")
         return None
 
-# Attempt to load the data
-responses = load_data(url, params)
-
-# Check if responses were successfully fetched before processing
-if responses:
-    all_hourly_data = []
-    
-    # The API returns a list of responses, we need to process each one
-    for response in responses:
-        hourly = response.Hourly()
-        hourly_ozone = hourly.Variables(0).ValuesAsNumpy()
-        hourly_pm = hourly.Variables(1).ValuesAsNumpy()
-        hourly_no = hourly.Variables(2).ValuesAsNumpy()
-
-        # Create a pandas DataFrame for the current response
-        hourly_data = {
-            "date": pd.date_range(
-                start=pd.to_datetime(hourly.Time(), unit="s", utc=True),
-                end=pd.to_datetime(hourly.TimeEnd(), unit='s', utc=True),
-                freq=pd.Timedelta(seconds=hourly.Interval()),
-                inclusive='left'
-            ),
-            'ozone': hourly_ozone,
-            'pm': hourly_pm,
-            'no':hourly_no
-        }
-        
-        # Add the DataFrame to a list
-        df = pd.DataFrame(data=hourly_data)
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-        df['date'] = pd.to_datetime(df['date']).dt.tz_convert('Africa/Nairobi')
-        df['day'] = df['date'].dt.date          # Extract the day
-        df.set_index('date', inplace=True)      # Set the index to the datetime column
-
-        
-        all_hourly_data.append(df)  
-
-        
-    # Concatenate all dataframes if there are multiple responses
-    if all_hourly_data:
-        combined_df = pd.concat(all_hourly_data)
-        st.dataframe(combined_df)
-        sunheader = st.subheader("Hourly Ozone and PM2.5 Levels")
-    else:
-        st.info("No hourly data found in the API response.")
-else:
-    st.info("No data could be loaded from the API. Please check your internet connection or the API URL.")
-
-# --- Ensure combined_df exists and is well-formed ---
-if 'combined_df' in locals() and not combined_df.empty:
-    # make sure index is datetime and timezone-aware
-    if not isinstance(combined_df.index, pd.DatetimeIndex):
-        combined_df.index = pd.to_datetime(combined_df.index)
-    # ensure 'day' column exists (date part in local TZ)
-    if 'day' not in combined_df.columns:
-        combined_df['day'] = combined_df.index.date
-
-    # --- Rolling / aggregated columns ---
+    hourly = hourlies[0]
+    return (
+        hourly.Time(),
+        hourly.TimeEnd(),
+        hourly.Interval(),
+        *(h.Variables(0).ValuesAsNumpy() for h in hourlies),
+    )
+
+
+# --- Rolling window kernels ---
+def rolling_mean_fixed(x, window):
+    """
+    Trailing mean over a fixed window with scipy's fused uniform filter, in O(n).
+    Matches pandas' rolling(window, min_periods=1).mean(): NaNs and the
+    positions before the start of the series are skipped.
+    """
+    # Shift the (centred) filter so each window ends at the current sample, and
+    # divide the filtered values by the filtered count of valid samples
+    origin = (window - 1) // 2
+    valid = ~np.isnan(x)
+    totals = uniform_filter1d(np.where(valid, x, 0), window, mode='constant', origin=origin)
+    counts = uniform_filter1d(valid.astype(x.dtype), window, mode='constant', origin=origin)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, totals / counts, np.nan).astype(x.dtype)
+
+
+def rolling_max_fixed(x, window):
+    """
+    Trailing max over a fixed window as one vectorised reduction.
+    Matches pandas' rolling(window, min_periods=1).max(): NaNs are skipped.
+    """
+    padded = np.concatenate((np.full(window - 1, np.nan, dtype=x.dtype), x))
+    return np.fmax.reduce(np.lib.stride_tricks.sliding_window_view(padded, window), axis=1)
+
+
+# --- Plot downsampling ---
+# Hourly series are thinned to about two points per horizontal pixel of a
+# 12-inch figure before plotting; more points are indistinguishable on screen.
+MAX_PLOT_POINTS = 2400
+
+
+def downsample_minmax(x, y, max_points=MAX_PLOT_POINTS):
+    """
+    Keeps the minimum and maximum of each of max_points // 2 equal buckets, in
+    time order, so line plots keep their peaks while drawing far fewer points.
+    Returns the (x, y) arrays to plot.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    if y.size <= max_points:
+        return x, y
+
+    bucket = -(-y.size // (max_points // 2))
+    n_buckets = -(-y.size // bucket)
+    padded = np.full(n_buckets * bucket, np.nan)
+    padded[:y.size] = y
+    padded = padded.reshape(n_buckets, bucket)
+    missing = np.isnan(padded)
+    lo = np.argmin(np.where(missing, np.inf, padded), axis=1)
+    hi = np.argmax(np.where(missing, -np.inf, padded), axis=1)
+    idx = (np.sort(np.column_stack((lo, hi)), axis=1) + bucket * np.arange(n_buckets)[:, None]).ravel()
+    return x[idx], y[idx]
+
+
+# --- Hourly and daily pollutant tables ---
+# compute_daily keeps the data as float32 NumPy tables with one row per series
+# (structure of arrays); pandas is only used to display them.
+HOURLY_COLUMNS = ['ozone', 'pm', 'no', 'ozone_8hr_rolling', 'no2_24hr_rolling_max']
+DAILY_COLUMNS = ['daily_ozone_mean', 'daily_pm_average', 'ozone_8hr_rolling_daily_mean',
+                 'daily_no2_max', 'no2_24hr_rolling_daily_mean']
+
+
+# Nairobi is UTC+3 all year (no DST), so local wall-clock time is a fixed
+# offset from UTC and the compute path needs no timezone object.
+NAIROBI_UTC_OFFSET = np.timedelta64(3, 'h')
+
+
+def local_days(times):
+    """
+    Calendar day of each naive local timestamp, as datetime64[D] rather than
+    boxed datetime.date objects.
+    """
+    return times.astype('datetime64[D]')
+
+
+@st.cache_data(ttl=86400)
+def compute_daily(_data, end_date_iso):
+    """
+    Builds the hourly table (with rolling rows) and its daily aggregation.
+    Keyed on end_date_iso only: the data is a pure function of the end date, so
+    the cache refreshes at the day boundary without hashing the arrays.
+    Returns a (times, x_hours, hourly, x_days, daily) tuple: times are naive
+    local datetime64 values, hourly and daily are laid out as HOURLY_COLUMNS x
+    hours and DAILY_COLUMNS x days, and x_hours and x_days are their matplotlib
+    date numbers.
+    """
+    time_start, time_end, interval, hourly_ozone, hourly_pm, hourly_no = _data
+
+    # Hourly timestamps as naive local wall-clock time, built in one pass from
+    # the UTC range
+    times = np.arange(
+        np.datetime64(time_start, 's'),
+        np.datetime64(time_end, 's'),
+        np.timedelta64(interval, 's'),
+    ) + NAIROBI_UTC_OFFSET
+
+    hourly = np.empty((len(HOURLY_COLUMNS), len(times)), dtype=np.float32)
+    ozone, pm, no2, ozone_8hr, no2_24hr_max = hourly
+    ozone[:], pm[:], no2[:] = hourly_ozone, hourly_pm, hourly_no
+
+    # --- Rolling rows ---
     # 8-hour rolling mean for ozone (hourly)
-    if 'ozone' in combined_df.columns:
-        combined_df['ozone_8hr_rolling'] = combined_df['ozone'].rolling(window=8, min_periods=1).mean()
-    else:
-        combined_df['ozone_8hr_rolling'] = pd.NA
+    ozone_8hr[:] = rolling_mean_fixed(ozone, 8)
 
     # 24-hour rolling max for NO2 (hourly)
-    if 'no' in combined_df.columns:
-        combined_df['no2_24hr_rolling_max'] = combined_df['no'].rolling(window=24, min_periods=1).max()
-    else:
-        combined_df['no2_24hr_rolling_max'] = pd.NA
+    no2_24hr_max[:] = rolling_max_fixed(no2, 24)
 
     # --- Daily aggregation ---
-    df_daily = combined_df.groupby('day').agg(
-        daily_ozone_mean=('ozone', 'mean'),
-        daily_pm_average=('pm', 'mean'),
-        ozone_8hr_rolling_daily_mean=('ozone_8hr_rolling', 'mean'),
-        daily_no2_max=('no', 'max'),
-        no2_24hr_rolling_daily_mean=('no2_24hr_rolling_max', 'mean')
-    ).reset_index()
+    # Rows are hourly and time-ordered, so every day is one contiguous slice
+    # and all the daily reductions can run as single reduceat passes.
+    day = local_days(times)
+    day_starts = np.flatnonzero(np.r_[True, day[1:] != day[:-1]])
+
+    to_mean = np.stack((ozone, pm, ozone_8hr, no2_24hr_max))
+    valid = ~np.isnan(to_mean)
+    sums = np.add.reduceat(np.where(valid, to_mean, 0), day_starts, axis=1)
+    counts = np.add.reduceat(valid, day_starts, axis=1)
+    with np.errstate(invalid='ignore'):
+        means = sums / counts
+
+    daily = np.empty((len(DAILY_COLUMNS), len(day_starts)), dtype=np.float32)
+    daily_ozone_mean, daily_pm_average, ozone_8hr_daily_mean, daily_no2_max, no2_24hr_daily_mean = daily
+    daily_ozone_mean[:], daily_pm_average[:], ozone_8hr_daily_mean[:], no2_24hr_daily_mean[:] = means
+    daily_no2_max[:] = np.fmax.reduceat(no2, day_starts)
+
+    # Matplotlib date numbers for the chart x-axes, converted once in NumPy
+    # instead of per chart from datetime objects
+    x_hours = mdates.date2num(times)
+    x_days = mdates.date2num(day[day_starts])
+
+    return times, x_hours, hourly, x_days, daily
+
+
+@st.cache_data(ttl=86400)
+def hourly_table(_times, _hourly, end_date_iso):
+    """
+    The hourly pollutant table as an Arrow table, built once per end date so
+    st.dataframe does not re-encode a pandas DataFrame on every rerun.
+    Only here are the naive local timestamps made timezone-aware again.
+    """
+    index = pd.DatetimeIndex(_times, name='date').tz_localize('Africa/Nairobi')
+    hourly_df = pd.DataFrame(_hourly[:3].T, columns=HOURLY_COLUMNS[:3], index=index)
+    hourly_df['day'] = local_days(_times)
+    return pa.Table.from_pandas(hourly_df)
+
+
+# --- Cached chart rendering ---
+# The charts only change when the end date does, so each one is rendered to
+# PNG bytes once per day and reruns just send the cached image.
+# Figures are created with matplotlib.figure.Figure rather than pyplot, so
+# they never enter pyplot's global registry and are freed with their last
+# reference instead of accumulating across reruns.
+def fig_to_png(fig):
+    """
+    Renders a matplotlib figure to PNG bytes, trimmed to its content the way
+    st.pyplot did, so no separate tight_layout pass is needed.
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=96, bbox_inches='tight')
+    return buf.getvalue()
+
+
+def plot_with_threshold(x, y, threshold, ylabel, title, *, label, exceed_label,
+                        guideline_label=None, x_label='Date', background=None,
+                        line_kwargs=None, marker_size=100, guideline_color='orange'):
+    """
+    Plots y against x (matplotlib date numbers) with the points above threshold
+    marked in red and the threshold as a dashed guideline. background is an
+    optional (x, y, label, color) series drawn faintly underneath.
+    Returns the figure.
+    """
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+    if background is not None:
+        background_x, background_y, background_label, background_color = background
+        ax.plot(*downsample_minmax(background_x, background_y), label=background_label,
+                color=background_color, alpha=0.6, zorder=1)
+    ax.plot(*downsample_minmax(x, y), label=label, zorder=2, **(line_kwargs or {}))
+    mask = y > threshold
+    if mask.any():
+        ax.scatter(x[mask], y[mask], color='red', s=marker_size, label=exceed_label, zorder=5)
+    ax.axhline(y=threshold, color=guideline_color, linestyle='--',
+               label=guideline_label or f'Guideline {threshold} µg/m³', zorder=0)
+    ax.set_title(title)
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(ylabel)
+    ax.legend()
+    ax.grid(True)
+    ax.xaxis_date()
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+    fig.autofmt_xdate()
+    return fig
+
+
+@st.cache_data(ttl=86400)
+def render_ozone_plot(_x_hours, _hourly, end_date_iso):
+    """
+    Hourly ozone with its 8-hour rolling mean, as PNG bytes.
+    """
+    ozone, _, _, ozone_8hr, _ = _hourly
+    return fig_to_png(plot_with_threshold(
+        _x_hours, ozone_8hr, OZONE_8HR_THRESHOLD, 'Ozone (µg/m³)',
+        'Hourly Ozone and 8-hour Rolling Mean (Nairobi)',
+        label='8-hr rolling mean',
+        exceed_label=f'8-hr mean > {OZONE_8HR_THRESHOLD} µg/m³',
+        x_label='Datetime',
+        background=(_x_hours, ozone, 'Hourly ozone', 'tab:blue'),
+        line_kwargs={'color': 'tab:green', 'linewidth': 2},
+        marker_size=50,
+    ))
+
+
+@st.cache_data(ttl=86400)
+def render_no2_plot(_x_hours, _hourly, end_date_iso):
+    """
+    Hourly NO2 with its 24-hour rolling max, as PNG bytes.
+    """
+    _, _, no2, _, no2_24hr_max = _hourly
+    return fig_to_png(plot_with_threshold(
+        _x_hours, no2_24hr_max, NO2_THRESHOLD, 'NO2 (µg/m³)',
+        'Hourly NO2 and 24-hour Rolling Max (Nairobi)',
+        label='24-hr rolling max',
+        exceed_label=f'24-hr max > {NO2_THRESHOLD} µg/m³',
+        x_label='Datetime',
+        background=(_x_hours, no2, 'Hourly NO2', 'tab:purple'),
+        line_kwargs={'color': 'tab:orange', 'linewidth': 2},
+        marker_size=50,
+        guideline_color='gray',
+    ))
+
+
+@st.cache_data(ttl=86400)
+def render_pm_plot(_x_hours, _hourly, _x_days, _daily, end_date_iso):
+    """
+    Hourly PM2.5 with the daily averages against the WHO guideline, as PNG bytes.
+    """
+    _, pm, _, _, _ = _hourly
+    _, daily_pm_average, _, _, _ = _daily
+    return fig_to_png(plot_with_threshold(
+        _x_days, daily_pm_average, PM_DAILY_THRESHOLD, 'PM2.5 Concentration (µg/m³)',
+        'Daily Average PM2.5 Concentration in Nairobi',
+        label='Daily PM2.5 average',
+        exceed_label=f'PM2.5 > {PM_DAILY_THRESHOLD} µg/m³',
+        guideline_label=f'WHO Guideline (Daily Mean {PM_DAILY_THRESHOLD} µg/m³)',
+        background=(_x_hours, pm, 'Hourly PM2.5', 'tab:blue'),
+        line_kwargs={'marker': 'o'},
+    ))
+
+
+@st.cache_data(ttl=86400)
+def render_no2_daily_plot(_x_days, _daily, end_date_iso):
+    """
+    Daily maximum NO2 against the guideline, as PNG bytes.
+    """
+    _, _, _, daily_no2_max, _ = _daily
+    return fig_to_png(plot_with_threshold(
+        _x_days, daily_no2_max, NO2_THRESHOLD, 'NO2 (µg/m³)',
+        'Daily Maximum NO2 Concentration in Nairobi',
+        label='Daily NO2 max',
+        exceed_label=f'NO2 > {NO2_THRESHOLD} µg/m³',
+        line_kwargs={'marker': 'o'},
+    ))
+
+
+def render_dashboard():
+    """
+    Fetches the hourly pollutant data, derives the rolling and daily
+    aggregates and renders the tables and charts, once per rerun.
+    """
+    data = load_data(url, params)
+
+    # Check if data was successfully fetched before processing
+    if data is None:
+        st.info("No data could be loaded from the API. Please check your internet connection or the API URL.")
+        return
+
+    if data[3].size == 0:
+        st.info("No hourly data found in the API response.")
+        return
+
+    end_date_iso = yesterday.isoformat()
+    times, x_hours, hourly, x_days, daily = compute_daily(data, end_date_iso)
+
+    st.dataframe(hourly_table(times, hourly, end_date_iso))
+    st.subheader("Hourly Ozone and PM2.5 Levels")
 
     # --- Hourly Ozone plot (raw + 8-hr rolling) ---
-    if 'ozone' in combined_df.columns:
-        fig, ax = plt.subplots(figsize=(12, 6))
-        sns.set_style("whitegrid")
-        ax.plot(combined_df.index, combined_df['ozone'], label='Hourly ozone', color='tab:blue', alpha=0.6, zorder=1)
-        if combined_df['ozone_8hr_rolling'].notna().any():
-            ax.plot(combined_df.index, combined_df['ozone_8hr_rolling'], label='8-hr rolling mean', color='tab:green', linewidth=2, zorder=2)
-            threshold_hourly_o3 = 100
-            above_hourly = combined_df[combined_df['ozone_8hr_rolling'] > threshold_hourly_o3]
-            if not above_hourly.empty:
-                ax.scatter(above_hourly.index, above_hourly['ozone_8hr_rolling'], color='red', s=50,
-                           label=f'8-hr mean > {threshold_hourly_o3} µg/m³', zorder=5)
-            ax.axhline(y=threshold_hourly_o3, color='orange', linestyle='--',
-                       label=f'Guideline {threshold_hourly_o3} µg/m³', zorder=0)
-        ax.set_title('Hourly Ozone and 8-hour Rolling Mean (Nairobi)')
-        ax.set_xlabel('Datetime')
-        ax.set_ylabel('Ozone (µg/m³)')
-        ax.legend()
-        ax.grid(True)
-        fig.autofmt_xdate()
-        plt.tight_layout()
-        st.pyplot(fig)
+    st.image(render_ozone_plot(x_hours, hourly, end_date_iso))
 
     # --- Hourly NO2 plot (raw + 24-hr rolling max) ---
-    if 'no' in combined_df.columns:
-        fig, ax = plt.subplots(figsize=(12, 6))
-        sns.set_style("whitegrid")
-        ax.plot(combined_df.index, combined_df['no'], label='Hourly NO2', color='tab:purple', alpha=0.6, zorder=1)
-        if combined_df['no2_24hr_rolling_max'].notna().any():
-            ax.plot(combined_df.index, combined_df['no2_24hr_rolling_max'], label='24-hr rolling max', color='tab:orange', linewidth=2, zorder=2)
-            threshold_no2 = 20
-            above_no2 = combined_df[combined_df['no2_24hr_rolling_max'] > threshold_no2]
-            if not above_no2.empty:
-                ax.scatter(above_no2.index, above_no2['no2_24hr_rolling_max'], color='red', s=50,
-                           label=f'24-hr max > {threshold_no2} µg/m³', zorder=5)
-            ax.axhline(y=threshold_no2, color='gray', linestyle='--', label=f'Guideline {threshold_no2} µg/m³', zorder=0)
-        ax.set_title('Hourly NO2 and 24-hour Rolling Max (Nairobi)')
-        ax.set_xlabel('Datetime')
-        ax.set_ylabel('NO2 (µg/m³)')
-        ax.legend()
-        ax.grid(True)
-        fig.autofmt_xdate()
-        plt.tight_layout()
-        st.pyplot(fig)
+    st.image(render_no2_plot(x_hours, hourly, end_date_iso))
 
     # --- Daily PM2.5 plot ---
-    if not df_daily.empty and 'daily_pm_average' in df_daily.columns:
-        st.subheader(f"Daily average PM2.5 levels up to {yesterday.strftime('%Y-%m-%d')}")
-        fig, ax = plt.subplots(figsize=(12, 6))
-        sns.set_style("whitegrid")
-        threshold_pm = 15
-        # plot hourly PM2.5 from combined_df (was incorrectly using df_hourly)
-        if 'pm' in combined_df.columns:
-            ax.plot(combined_df.index, combined_df['pm'], label='Hourly PM2.5', color='tab:blue', alpha=0.6, zorder=1)
-        sns.lineplot(x='day', y='daily_pm_average', data=df_daily, marker='o', label='Daily PM2.5 average', ax=ax, zorder=2)
-        above_threshold_pm = df_daily[df_daily['daily_pm_average'] > threshold_pm]
-        if not above_threshold_pm.empty:
-            sns.scatterplot(x='day', y='daily_pm_average', data=above_threshold_pm, color='red', s=100,
-                            label=f'PM2.5 > {threshold_pm} µg/m³', ax=ax, zorder=3)
-        ax.axhline(y=threshold_pm, color='orange', linestyle='--', label=f'WHO Guideline (Daily Mean {threshold_pm} µg/m³)', zorder=0)
-        ax.set_title('Daily Average PM2.5 Concentration in Nairobi')
-        ax.set_xlabel('Date')
-        ax.set_ylabel('PM2.5 Concentration (µg/m³)')
-        ax.legend()
-        ax.grid(True)
-        fig.autofmt_xdate()
-        plt.tight_layout()
-        st.pyplot(fig)
-
-    
+    if x_days.size:
+        st.subheader(f"Daily average PM2.5 levels up to {end_date_iso}")
+        st.image(render_pm_plot(x_hours, hourly, x_days, daily, end_date_iso))
 
     # --- Daily maximum NO2 plot ---
-    if not df_daily.empty and 'daily_no2_max' in df_daily.columns:
-        st.subheader(f"Daily maximum NO2 levels up to {yesterday.strftime('%Y-%m-%d')}")
-        fig, ax = plt.subplots(figsize=(12, 6))
-        sns.set_style("whitegrid")
-        sns.lineplot(x='day', y='daily_no2_max', data=df_daily, marker='o', label='Daily NO2 max', ax=ax, zorder=1)
-        threshold_no2 = 20
-        above = df_daily[df_daily['daily_no2_max'] > threshold_no2]
-        if not above.empty:
-            sns.scatterplot(x='day', y='daily_no2_max', data=above, color='red', s=100,
-                            label=f'NO2 > {threshold_no2} µg/m³', ax=ax, zorder=2)
-        ax.axhline(y=threshold_no2, color='orange', linestyle='--', label=f'Guideline {threshold_no2} µg/m³', zorder=0)
-        ax.set_title('Daily Maximum NO2 Concentration in Nairobi')
-        ax.set_xlabel('Date')
-        ax.set_ylabel('NO2 (µg/m³)')
-        ax.grid(True)
-        fig.autofmt_xdate()
-        plt.tight_layout()
-        st.pyplot(fig)
+    if x_days.size:
+        st.subheader(f"Daily maximum NO2 levels up to {end_date_iso}")
+        st.image(render_no2_daily_plot(x_days, daily, end_date_iso))
     else:
         st.info("No daily NO2 data available to plot.")
-else:
-    st.info("No combined hourly data available to compute plots.")
-
 
 
+render_dashboard()